@@ -1,80 +1,261 @@
 #!/usr/bin/env python3
 """Generate Markdown report from purity test JSON results."""
 
-import json
+import functools
+import mmap
+import os
 import sys
-from pathlib import Path
+from itertools import groupby
 
+try:
+    import orjson
 
+    loads = orjson.loads
+    # orjson parses memoryviews directly, so large files are mmapped instead of copied
+    MMAP_MIN_SIZE = 64 * 1024
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    import json
+
+    loads = json.loads
+    MMAP_MIN_SIZE = None  # json.loads needs bytes
+
+# Matrix cell strings, keyed by the JSON field value
+_IMPURE_CELL = {"accumulate": " ☠️ |", "overwrite": " ⚠️ |"}
+_PURITY_CHANGE = {0: "✅ → ☠️ (became impure)", 1: "☠️ → ✅ (became pure)"}  # keyed by new code
+_CLONE_CELL = {None: " - |", 0: " **0** |", 1: " 1 |", 2: " 2 |", -1: " -1 |"}  # 0 is dangerous
+
+
+@functools.lru_cache(maxsize=None)
 def version_key(v):
     """Sort key for version strings like v1.20.0."""
-    parts = v.replace("v", "").split(".")
-    return tuple(int(p) for p in parts)
+    return tuple(map(int, v[1:].split(".")))
+
+
+def load_result(entry):
+    """Read and parse one (version, path) purity JSON entry, returning (version, data)."""
+    version, path = entry
+    with open(path, "rb") as fp:
+        if MMAP_MIN_SIZE is None or os.fstat(fp.fileno()).st_size <= MMAP_MIN_SIZE:
+            return sys.intern(version), loads(fp.read())
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+                if hasattr(mmap, advice):
+                    mm.madvise(getattr(mmap, advice))
+            with memoryview(mm) as buf:
+                return sys.intern(version), loads(buf)
+
+
+def version_ranges(versions, key):
+    """Group consecutive versions sharing key(version) into (start, end, value) ranges.
+
+    A leading group whose key is all None (no data yet) is skipped; later gaps are kept.
+    """
+    ranges = []
+    for value, group in groupby(versions, key=key):
+        group = list(group)
+        if not ranges and all(v is None for v in value):
+            continue
+        ranges.append((group[0], group[-1], value))
+    return ranges
+
+
+def changed_values(prev, curr):
+    """Sorted (method, old, new) for methods present in both maps whose value changed."""
+    changes = []
+    for method, old in prev.items():
+        new = curr.get(method)
+        if new is not None and new != old:
+            changes.append((method, old, new))
+    changes.sort()
+    return changes
+
+
+def format_purity(m):
+    """Purity Matrix cell: pure, impure-overwrite, impure-accumulate or unknown."""
+    pure = m.get("pure")
+    if pure is False:
+        return _IMPURE_CELL.get(m.get("impure_mode"), " ❓ |")
+    return " ✅ |" if pure is True else " - |"
+
+
+def format_flag(key):
+    """Cell formatter for a boolean field (✅=true, ☠️=false)."""
+
+    def fmt(m):
+        value = m.get(key)
+        if value is True:
+            return " ✅ |"
+        if value is False:
+            return " ☠️ |"
+        return " - |"
+
+    return fmt
+
+
+def format_clone(key):
+    """Cell formatter for a clone value field (0 is highlighted as dangerous)."""
+
+    def fmt(m):
+        clone = m.get(key)
+        cell = _CLONE_CELL.get(clone)
+        return cell if cell is not None else f" {clone} |"
+
+    return fmt
+
+
+def render_matrix(emit, methods, mbv, header, row_prefix, fmt):
+    """Emit a method × version matrix; mbv holds only existing methods, the rest are N/A."""
+    emit(header)
+    getters = [mv.get for mv in mbv]  # bound once, not per cell
+    for method in methods:
+        emit(row_prefix[method])
+        for get in getters:
+            m = get(method)
+            if m is None:
+                emit(" - |")
+            else:
+                emit(fmt(m))
+        emit("\n")
+    emit("\n")
 
 
 def main():
-    purity_dir = Path(sys.argv[1] if len(sys.argv) > 1 else "purity")
+    purity_dir = sys.argv[1] if len(sys.argv) > 1 else "purity"
 
-    if not purity_dir.is_dir():
+    # (version, path) for each v*.json entry
+    try:
+        with os.scandir(purity_dir) as it:
+            json_files = [(e.name[:-5], e.path) for e in it if e.name.startswith("v") and e.name.endswith(".json")]
+    except OSError:
         print(f"Error: {purity_dir} is not a directory", file=sys.stderr)
         sys.exit(1)
-
-    json_files = sorted(purity_dir.glob("v*.json"), key=lambda p: version_key(p.stem))
+    json_files.sort(key=lambda f: version_key(f[0]))
 
     if not json_files:
         print(f"Error: No JSON files found in {purity_dir}", file=sys.stderr)
         sys.exit(1)
 
-    # Load all results
-    results = {}
+    # Load all results, then collect method sets and changes in one pass
+    results = dict(map(load_result, json_files))
+
     all_methods = set()
-    for f in json_files:
-        with open(f) as fp:
-            data = json.load(fp)
-            version = f.stem
-            results[version] = data
-            all_methods.update(data.get("methods", {}).keys())
+    methods_with_immutable = set()
+    methods_with_return_clone = set()
+    methods_with_callback_clone = set()
+    methods_with_callback_immutable = set()
+    # Per-version {method: value} projections, holding only methods with a value
+    pure_map = {}  # 1=pure, 0=impure
+    return_clone_map = {}
+    callback_clone_map = {}
+    # Per-version {method: data} restricted to methods that exist in that version
+    existing_map = {}
+    # Changes against the previous version, as (prev_version, version, lines)
+    purity_changes = []
+    clone_changes = []
+    prev_version = None
+    for version, data in results.items():
+        existing = existing_map[version] = {}
+        pure = pure_map[version] = {}
+        return_clone = return_clone_map[version] = {}
+        callback_clone = callback_clone_map[version] = {}
+        for method, m in data.get("methods", {}).items():
+            all_methods.add(method)
+            if m.get("exists", False):
+                existing[method] = m
+            value = m.get("pure")
+            if value is True:
+                pure[method] = 1
+            elif value is False:
+                pure[method] = 0
+            value = m.get("return_clone")
+            if value is not None:
+                return_clone[method] = value
+            value = m.get("callback_clone")
+            if value is not None:
+                callback_clone[method] = value
+            if "immutable_return" in m:
+                methods_with_immutable.add(method)
+            if "return_clone" in m:
+                methods_with_return_clone.add(method)
+            if "callback_clone" in m:
+                methods_with_callback_clone.add(method)
+            if "callback_arg_immutable" in m:
+                methods_with_callback_immutable.add(method)
+
+        if prev_version is not None:
+            lines = [
+                f"- **{method}**: {_PURITY_CHANGE[new]}\n"
+                for method, _, new in changed_values(pure_map[prev_version], pure)
+            ]
+            if lines:
+                purity_changes.append((prev_version, version, lines))
+
+            # return_clone before callback_clone within each method
+            rows = [
+                (method, 0, f"- **{method}** return_clone: {old} → {new}\n")
+                for method, old, new in changed_values(return_clone_map[prev_version], return_clone)
+            ]
+            rows += [
+                (method, 1, f"- **{method}** callback_clone: {old} → {new}\n")
+                for method, old, new in changed_values(callback_clone_map[prev_version], callback_clone)
+            ]
+            if rows:
+                rows.sort()
+                clone_changes.append((prev_version, version, [line for _, _, line in rows]))
+        prev_version = version
 
     # versions_asc: oldest first (for change detection sections)
     # versions: newest first (for matrix columns - more recent = more valuable)
-    versions_asc = [f.stem for f in json_files]
+    versions_asc = list(results)
     versions = list(reversed(versions_asc))
-    all_methods = sorted(all_methods)
+    all_methods = [sys.intern(m) for m in sorted(all_methods)]
+    # "| Method |" row prefixes shared by every matrix
+    row_prefix = {m: f"| {m} |" for m in all_methods}
     short_versions = [v.replace("v1.", "") for v in versions]
+    # Per-version existing-method dicts, parallel to versions
+    mbv = [existing_map[v] for v in versions]
+    # Header and separator rows shared by every matrix
+    matrix_header = (
+        "| Method | " + " | ".join(short_versions) + " |\n"
+        "|--------| " + "|".join(["------"] * len(versions)) + " |\n"
+    )
+
+    out = []
+    emit = out.append
 
     # Print header
-    print("# GORM Purity Survey Results")
-    print()
-    print("This document summarizes the purity behavior of `*gorm.DB` methods across all surveyed GORM versions.")
-    print()
-    print("## Legend")
-    print()
-    print("### Purity")
-    print("- ✅ **Pure**: Method does NOT pollute the receiver")
-    print("- ⚠️ **Impure-Overwrite**: Pollutes receiver, but repeated calls overwrite (less dangerous)")
-    print("- ☠️ **Impure-Accumulate**: Pollutes receiver, repeated calls stack up (DANGEROUS)")
-    print()
-    print("### Immutable-Return")
-    print("- ✅ **Immutable**: Returned `*gorm.DB` can be safely reused/branched")
-    print("- ☠️ **Mutable**: Returned `*gorm.DB` is mutable (branches interfere)")
-    print()
-    print("### Clone Values")
-    print("- `0`: No cloning (DANGEROUS - mutations leak)")
-    print("- `1`: Clone Statement with empty Clauses")
-    print("- `2`: Full clone (Statement.clone(), keeps Clauses)")
-    print("- `-1`: Not detected / N/A")
-    print()
-    print("## Overview")
-    print()
-    print(f"- **Versions surveyed**: {len(versions)}")
-    print(f"- **Version range**: {versions_asc[0]} ~ {versions_asc[-1]}")
-    print()
+    emit("# GORM Purity Survey Results\n")
+    emit("\n")
+    emit("This document summarizes the purity behavior of `*gorm.DB` methods across all surveyed GORM versions.\n")
+    emit("\n")
+    emit("## Legend\n")
+    emit("\n")
+    emit("### Purity\n")
+    emit("- ✅ **Pure**: Method does NOT pollute the receiver\n")
+    emit("- ⚠️ **Impure-Overwrite**: Pollutes receiver, but repeated calls overwrite (less dangerous)\n")
+    emit("- ☠️ **Impure-Accumulate**: Pollutes receiver, repeated calls stack up (DANGEROUS)\n")
+    emit("\n")
+    emit("### Immutable-Return\n")
+    emit("- ✅ **Immutable**: Returned `*gorm.DB` can be safely reused/branched\n")
+    emit("- ☠️ **Mutable**: Returned `*gorm.DB` is mutable (branches interfere)\n")
+    emit("\n")
+    emit("### Clone Values\n")
+    emit("- `0`: No cloning (DANGEROUS - mutations leak)\n")
+    emit("- `1`: Clone Statement with empty Clauses\n")
+    emit("- `2`: Full clone (Statement.clone(), keeps Clauses)\n")
+    emit("- `-1`: Not detected / N/A\n")
+    emit("\n")
+    emit("## Overview\n")
+    emit("\n")
+    emit(f"- **Versions surveyed**: {len(versions)}\n")
+    emit(f"- **Version range**: {versions_asc[0]} ~ {versions_asc[-1]}\n")
+    emit("\n")
 
     # Summary table
-    print("## Summary by Version")
-    print()
-    print("| Version | Total | Pure | Impure | Immutable |")
-    print("|---------|-------|------|--------|-----------|")
+    emit("## Summary by Version\n")
+    emit("\n")
+    emit("| Version | Total | Pure | Impure | Immutable |\n")
+    emit("|---------|-------|------|--------|-----------|\n")
 
     for version in versions:
         data = results[version]
@@ -83,355 +264,137 @@ def main():
         pure = summary.get("pure_methods", 0)
         impure = summary.get("impure_methods", 0)
         immutable = summary.get("immutable_count", 0)
-        print(f"| {version} | {total} | {pure} | {impure} | {immutable} |")
+        emit(f"| {version} | {total} | {pure} | {impure} | {immutable} |\n")
 
-    print()
+    emit("\n")
 
     # Method Purity Matrix (with impure_mode)
-    print("## Method Purity Matrix")
-    print()
-    print("Purity behavior for each method across versions:")
-    print("- ✅ = pure")
-    print("- ⚠️ = impure-overwrite")
-    print("- ☠️ = impure-accumulate")
-    print("- ❓ = impure (mode unknown)")
-    print("- `-` = N/A")
-    print()
-
-    # Header row
-    print("| Method |", " | ".join(short_versions), "|")
-    print("|--------|", "|".join(["------"] * len(versions)), "|")
-
-    # Data rows
-    for method in all_methods:
-        row = [f"| {method} |"]
-        for version in versions:
-            methods = results[version].get("methods", {})
-            m = methods.get(method, {})
-            if not m.get("exists", False):
-                row.append(" - |")
-            else:
-                pure = m.get("pure")
-                impure_mode = m.get("impure_mode")
-                if pure is True:
-                    row.append(" ✅ |")
-                elif pure is False:
-                    if impure_mode == "accumulate":
-                        row.append(" ☠️ |")
-                    elif impure_mode == "overwrite":
-                        row.append(" ⚠️ |")
-                    else:
-                        row.append(" ❓ |")
-                else:
-                    row.append(" - |")
-        print("".join(row))
-
-    print()
+    emit("## Method Purity Matrix\n")
+    emit("\n")
+    emit("Purity behavior for each method across versions:\n")
+    emit("- ✅ = pure\n")
+    emit("- ⚠️ = impure-overwrite\n")
+    emit("- ☠️ = impure-accumulate\n")
+    emit("- ❓ = impure (mode unknown)\n")
+    emit("- `-` = N/A\n")
+    emit("\n")
+
+    render_matrix(emit, all_methods, mbv, matrix_header, row_prefix, format_purity)
 
     # Immutable-Return Matrix
-    print("## Immutable-Return Matrix")
-    print()
-    print('Whether returned `*gorm.DB` is immutable (✅=immutable, ☠️=mutable, -=N/A):')
-    print()
-
-    # Find methods with immutable_return data
-    methods_with_immutable = set()
-    for version in versions:
-        for method, m in results[version].get("methods", {}).items():
-            if "immutable_return" in m:
-                methods_with_immutable.add(method)
-    methods_with_immutable = sorted(methods_with_immutable)
-
-    # Header row
-    print("| Method |", " | ".join(short_versions), "|")
-    print("|--------|", "|".join(["------"] * len(versions)), "|")
-
-    # Data rows
-    for method in methods_with_immutable:
-        row = [f"| {method} |"]
-        for version in versions:
-            methods = results[version].get("methods", {})
-            m = methods.get(method, {})
-            if not m.get("exists", False):
-                row.append(" - |")
-            else:
-                imm = m.get("immutable_return")
-                if imm is True:
-                    row.append(" ✅ |")
-                elif imm is False:
-                    row.append(" ☠️ |")
-                else:
-                    row.append(" - |")
-        print("".join(row))
-
-    print()
+    if methods_with_immutable:
+        emit("## Immutable-Return Matrix\n")
+        emit("\n")
+        emit('Whether returned `*gorm.DB` is immutable (✅=immutable, ☠️=mutable, -=N/A):\n')
+        emit("\n")
+        render_matrix(
+            emit, sorted(methods_with_immutable), mbv, matrix_header, row_prefix, format_flag("immutable_return")
+        )
 
     # Clone Value Matrix (return_clone)
-    print("## Return Clone Value Matrix")
-    print()
-    print("The `clone` field value of returned `*gorm.DB` (determines immutability):")
-    print()
-
-    # Find methods with return_clone data
-    methods_with_return_clone = set()
-    for version in versions:
-        for method, m in results[version].get("methods", {}).items():
-            if "return_clone" in m:
-                methods_with_return_clone.add(method)
-    methods_with_return_clone = sorted(methods_with_return_clone)
-
     if methods_with_return_clone:
-        # Header row
-        print("| Method |", " | ".join(short_versions), "|")
-        print("|--------|", "|".join(["------"] * len(versions)), "|")
-
-        # Data rows
-        for method in methods_with_return_clone:
-            row = [f"| {method} |"]
-            for version in versions:
-                methods = results[version].get("methods", {})
-                m = methods.get(method, {})
-                if not m.get("exists", False):
-                    row.append(" - |")
-                else:
-                    clone = m.get("return_clone")
-                    if clone is None:
-                        row.append(" - |")
-                    elif clone == 0:
-                        row.append(" **0** |")  # Dangerous
-                    elif clone == 1:
-                        row.append(" 1 |")
-                    elif clone == 2:
-                        row.append(" 2 |")
-                    else:
-                        row.append(f" {clone} |")
-            print("".join(row))
-
-        print()
+        emit("## Return Clone Value Matrix\n")
+        emit("\n")
+        emit("The `clone` field value of returned `*gorm.DB` (determines immutability):\n")
+        emit("\n")
+        render_matrix(
+            emit, sorted(methods_with_return_clone), mbv, matrix_header, row_prefix, format_clone("return_clone")
+        )
 
     # Callback Clone Value Matrix
-    print("## Callback Clone Value Matrix")
-    print()
-    print("The `clone` field value of `*gorm.DB` passed to callbacks:")
-    print()
-
-    # Find methods with callback_clone data
-    methods_with_callback_clone = set()
-    for version in versions:
-        for method, m in results[version].get("methods", {}).items():
-            if "callback_clone" in m:
-                methods_with_callback_clone.add(method)
-    methods_with_callback_clone = sorted(methods_with_callback_clone)
-
     if methods_with_callback_clone:
-        # Header row
-        print("| Method |", " | ".join(short_versions), "|")
-        print("|--------|", "|".join(["------"] * len(versions)), "|")
-
-        # Data rows
-        for method in methods_with_callback_clone:
-            row = [f"| {method} |"]
-            for version in versions:
-                methods = results[version].get("methods", {})
-                m = methods.get(method, {})
-                if not m.get("exists", False):
-                    row.append(" - |")
-                else:
-                    clone = m.get("callback_clone")
-                    if clone is None:
-                        row.append(" - |")
-                    elif clone == -1:
-                        row.append(" -1 |")  # Not detected
-                    elif clone == 0:
-                        row.append(" **0** |")  # Dangerous
-                    elif clone == 1:
-                        row.append(" 1 |")
-                    elif clone == 2:
-                        row.append(" 2 |")
-                    else:
-                        row.append(f" {clone} |")
-            print("".join(row))
-
-        print()
+        emit("## Callback Clone Value Matrix\n")
+        emit("\n")
+        emit("The `clone` field value of `*gorm.DB` passed to callbacks:\n")
+        emit("\n")
+        render_matrix(
+            emit, sorted(methods_with_callback_clone), mbv, matrix_header, row_prefix, format_clone("callback_clone")
+        )
 
     # Callback Argument Immutability Matrix
-    print("## Callback Argument Immutability Matrix")
-    print()
-    print("Whether callback's `*gorm.DB` argument is immutable (✅=immutable, ☠️=mutable):")
-    print()
-
-    # Find methods with callback_arg_immutable data
-    methods_with_callback_immutable = set()
-    for version in versions:
-        for method, m in results[version].get("methods", {}).items():
-            if "callback_arg_immutable" in m:
-                methods_with_callback_immutable.add(method)
-    methods_with_callback_immutable = sorted(methods_with_callback_immutable)
-
     if methods_with_callback_immutable:
-        # Header row
-        print("| Method |", " | ".join(short_versions), "|")
-        print("|--------|", "|".join(["------"] * len(versions)), "|")
-
-        # Data rows
-        for method in methods_with_callback_immutable:
-            row = [f"| {method} |"]
-            for version in versions:
-                methods = results[version].get("methods", {})
-                m = methods.get(method, {})
-                if not m.get("exists", False):
-                    row.append(" - |")
-                else:
-                    imm = m.get("callback_arg_immutable")
-                    if imm is True:
-                        row.append(" ✅ |")
-                    elif imm is False:
-                        row.append(" ☠️ |")
-                    else:
-                        row.append(" - |")
-            print("".join(row))
-
-        print()
+        emit("## Callback Argument Immutability Matrix\n")
+        emit("\n")
+        emit("Whether callback's `*gorm.DB` argument is immutable (✅=immutable, ☠️=mutable):\n")
+        emit("\n")
+        render_matrix(
+            emit,
+            sorted(methods_with_callback_immutable),
+            mbv,
+            matrix_header,
+            row_prefix,
+            format_flag("callback_arg_immutable"),
+        )
 
     # Purity Changes (chronological order: oldest to newest)
-    print("## Purity Changes Between Versions")
-    print()
-    print("Methods whose purity behavior changed between versions:")
-    print()
+    emit("## Purity Changes Between Versions\n")
+    emit("\n")
+    emit("Methods whose purity behavior changed between versions:\n")
+    emit("\n")
 
-    prev_version = None
-    for version in versions_asc:
-        if prev_version:
-            changes = []
-            for method in all_methods:
-                prev_data = results[prev_version].get("methods", {}).get(method, {})
-                curr_data = results[version].get("methods", {}).get(method, {})
-                prev_pure = prev_data.get("pure")
-                curr_pure = curr_data.get("pure")
-
-                if prev_pure is not None and curr_pure is not None and prev_pure != curr_pure:
-                    if prev_pure is True and curr_pure is False:
-                        changes.append(f"- **{method}**: ✅ → ☠️ (became impure)")
-                    elif prev_pure is False and curr_pure is True:
-                        changes.append(f"- **{method}**: ☠️ → ✅ (became pure)")
-
-            if changes:
-                print(f"### {prev_version} → {version}")
-                for c in changes:
-                    print(c)
-                print()
-        prev_version = version
+    for prev_version, version, lines in purity_changes:
+        emit(f"### {prev_version} → {version}\n")
+        for line in lines:
+            emit(line)
+        emit("\n")
 
     # Clone Value Changes (chronological order: oldest to newest)
-    print("## Clone Value Changes Between Versions")
-    print()
-    print("Methods whose clone values changed between versions:")
-    print()
+    emit("## Clone Value Changes Between Versions\n")
+    emit("\n")
+    emit("Methods whose clone values changed between versions:\n")
+    emit("\n")
 
-    prev_version = None
-    for version in versions_asc:
-        if prev_version:
-            changes = []
-            for method in all_methods:
-                prev_data = results[prev_version].get("methods", {}).get(method, {})
-                curr_data = results[version].get("methods", {}).get(method, {})
-
-                # Check return_clone
-                prev_clone = prev_data.get("return_clone")
-                curr_clone = curr_data.get("return_clone")
-                if prev_clone is not None and curr_clone is not None and prev_clone != curr_clone:
-                    changes.append(f"- **{method}** return_clone: {prev_clone} → {curr_clone}")
-
-                # Check callback_clone
-                prev_cb = prev_data.get("callback_clone")
-                curr_cb = curr_data.get("callback_clone")
-                if prev_cb is not None and curr_cb is not None and prev_cb != curr_cb:
-                    changes.append(f"- **{method}** callback_clone: {prev_cb} → {curr_cb}")
-
-            if changes:
-                print(f"### {prev_version} → {version}")
-                for c in changes:
-                    print(c)
-                print()
-        prev_version = version
+    for prev_version, version, lines in clone_changes:
+        emit(f"### {prev_version} → {version}\n")
+        for line in lines:
+            emit(line)
+        emit("\n")
 
     # Key Findings Summary
-    print("## Key Findings Summary")
-    print()
-    print("### Session/Begin Clone Value Swap")
-    print()
-    print("| Version Range | Session | Begin |")
-    print("|---------------|---------|-------|")
+    emit("## Key Findings Summary\n")
+    emit("\n")
+    emit("### Session/Begin Clone Value Swap\n")
+    emit("\n")
+    emit("| Version Range | Session | Begin |\n")
+    emit("|---------------|---------|-------|\n")
 
     # Detect session/begin clone value ranges (chronological)
-    session_begin_ranges = []
-    current_session = None
-    current_begin = None
-    range_start = None
-
-    for version in versions_asc:
-        m = results[version].get("methods", {})
-        session_clone = m.get("Session", {}).get("return_clone")
-        begin_clone = m.get("Begin", {}).get("return_clone")
-
-        if session_clone != current_session or begin_clone != current_begin:
-            if range_start is not None:
-                session_begin_ranges.append((range_start, prev_version, current_session, current_begin))
-            range_start = version
-            current_session = session_clone
-            current_begin = begin_clone
-        prev_version = version
+    session_begin_ranges = version_ranges(
+        versions_asc, lambda v: (return_clone_map[v].get("Session"), return_clone_map[v].get("Begin"))
+    )
 
-    if range_start is not None:
-        session_begin_ranges.append((range_start, versions_asc[-1], current_session, current_begin))
-
-    for start, end, session, begin in session_begin_ranges:
+    for start, end, (session, begin) in session_begin_ranges:
         if start == end:
-            print(f"| {start} | {session} | {begin} |")
+            emit(f"| {start} | {session} | {begin} |\n")
         else:
-            print(f"| {start} ~ {end} | {session} | {begin} |")
+            emit(f"| {start} ~ {end} | {session} | {begin} |\n")
 
-    print()
+    emit("\n")
 
     # Scopes Clone Value Changes
-    print("### Scopes Clone Value Changes")
-    print()
-    print("| Version Range | return_clone | callback_clone |")
-    print("|---------------|--------------|----------------|")
-
-    scopes_ranges = []
-    current_return = None
-    current_cb = None
-    range_start = None
-
-    for version in versions_asc:
-        m = results[version].get("methods", {})
-        return_clone = m.get("Scopes", {}).get("return_clone")
-        cb_clone = m.get("Scopes", {}).get("callback_clone")
-
-        if return_clone != current_return or cb_clone != current_cb:
-            if range_start is not None:
-                scopes_ranges.append((range_start, prev_version, current_return, current_cb))
-            range_start = version
-            current_return = return_clone
-            current_cb = cb_clone
-        prev_version = version
+    emit("### Scopes Clone Value Changes\n")
+    emit("\n")
+    emit("| Version Range | return_clone | callback_clone |\n")
+    emit("|---------------|--------------|----------------|\n")
 
-    if range_start is not None:
-        scopes_ranges.append((range_start, versions_asc[-1], current_return, current_cb))
+    scopes_ranges = version_ranges(
+        versions_asc, lambda v: (return_clone_map[v].get("Scopes"), callback_clone_map[v].get("Scopes"))
+    )
 
-    for start, end, ret, cb in scopes_ranges:
+    for start, end, (ret, cb) in scopes_ranges:
         cb_display = f"**{cb}**" if cb == 0 else str(cb) if cb is not None else "-"
         if start == end:
-            print(f"| {start} | {ret} | {cb_display} |")
+            emit(f"| {start} | {ret} | {cb_display} |\n")
         else:
-            print(f"| {start} ~ {end} | {ret} | {cb_display} |")
+            emit(f"| {start} ~ {end} | {ret} | {cb_display} |\n")
+
+    emit("\n")
 
-    print()
+    emit("---\n")
+    emit("\n")
+    emit("*Generated by gorm-purity-survey*\n")
 
-    print("---")
-    print()
-    print("*Generated by gorm-purity-survey*")
+    sys.stdout.write("".join(out))
 
 
 if __name__ == "__main__":